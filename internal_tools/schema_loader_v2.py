@@ -3,10 +3,20 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict, Mapping
+from typing import Any, Dict, Mapping, Tuple
 
 import yaml
-from jsonschema import Draft7Validator, ValidationError
+from jsonschema import Draft7Validator, SchemaError, ValidationError
+
+try:  # orjson (opcional): parsea los schemas desde bytes, sin decodificar a str
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - sin orjson: json de la stdlib
+    _orjson = None
+
+try:  # libyaml (C): mismo resultado que safe_load, bastante más rápido
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML sin libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
 __all__ = [
     "SchemaValidationError",
@@ -31,27 +41,28 @@ class SchemaValidationError(Exception):
 
 
 def _load_yaml(path: Path) -> Any:
+    # Se pasa el fichero binario tal cual: libyaml lee y decodifica los bytes
+    # sin materializar antes el texto completo como str de Python.
     try:
-        text = path.read_text(encoding="utf-8")
+        with path.open("rb") as fh:
+            return yaml.load(fh, Loader=_YamlLoader)
     except OSError as exc:
         raise SchemaValidationError(f"Cannot read YAML file {path}: {exc}") from exc
-
-    try:
-        return yaml.safe_load(text)
     except yaml.YAMLError as exc:
         raise SchemaValidationError(f"YAML syntax error in {path}: {exc}") from exc
 
 
 def _load_json_schema(schema_path: Path) -> Dict[str, Any]:
     try:
-        text = schema_path.read_text(encoding="utf-8")
+        raw = schema_path.read_bytes()
     except OSError as exc:
         raise SchemaValidationError(
             f"Cannot read JSON Schema file {schema_path}: {exc}"
         ) from exc
 
     try:
-        schema = json.loads(text)
+        # orjson.JSONDecodeError hereda de json.JSONDecodeError
+        schema = _orjson.loads(raw) if _orjson is not None else json.loads(raw)
     except json.JSONDecodeError as exc:
         raise SchemaValidationError(
             f"JSON error in schema file {schema_path}: {exc}"
@@ -63,6 +74,38 @@ def _load_json_schema(schema_path: Path) -> Dict[str, Any]:
     return dict(schema)
 
 
+# Validadores ya construidos por ruta de schema, con el mtime del fichero:
+# cada schema se lee, se comprueba y se compila una sola vez por proceso
+# (y de nuevo solo si el fichero cambia en disco).
+_VALIDATOR_CACHE: Dict[str, Tuple[int, Draft7Validator]] = {}
+
+
+def _validator_for(schema_path: Path) -> Draft7Validator:
+    try:
+        mtime = schema_path.stat().st_mtime_ns
+    except OSError as exc:
+        raise SchemaValidationError(
+            f"Cannot read JSON Schema file {schema_path}: {exc}"
+        ) from exc
+
+    key = str(schema_path)
+    cached = _VALIDATOR_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    schema = _load_json_schema(schema_path)
+    try:
+        Draft7Validator.check_schema(schema)
+    except SchemaError as exc:
+        raise SchemaValidationError(
+            f"Invalid JSON Schema {schema_path}: {exc.message}"
+        ) from exc
+
+    validator = Draft7Validator(schema)
+    _VALIDATOR_CACHE[key] = (mtime, validator)
+    return validator
+
+
 def validate_instance_against_schema(
     *, instance: Any, schema_path: Path, context: str = ""
 ) -> None:
@@ -71,16 +114,19 @@ def validate_instance_against_schema(
 
     Lanza SchemaValidationError con un mensaje limpio si falla.
     """
-    schema = _load_json_schema(schema_path)
+    validator = _validator_for(schema_path)
 
-    validator = Draft7Validator(schema)
-    errors = sorted(validator.iter_errors(instance), key=lambda e: e.path)
-
-    if not errors:
+    # Camino feliz: is_valid corta en cuanto hay un error y no acumula nada;
+    # solo si falla se recorren todos los errores para el diagnóstico.
+    if validator.is_valid(instance):
         return
 
-    # De momento devolvemos solo el primer error, pero con info suficiente.
-    first: ValidationError = errors[0]
+    # De momento devolvemos solo el primer error (por ruta), pero con info
+    # suficiente: min() lo encuentra en una pasada, sin lista ni ordenación
+    # (mismo resultado que sorted(...)[0], que también es estable).
+    first: ValidationError = min(
+        validator.iter_errors(instance), key=lambda e: tuple(e.path)
+    )
 
     path_str = "/".join(str(p) for p in first.path) or "<root>"
     base_msg = f"{schema_path.name}: at {path_str}: {first.message}"
@@ -142,32 +188,53 @@ MODE_SYNONYMS: Dict[str, str] = {
 }
 
 
+def _first(d: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """Valor de la primera clave PRESENTE de `keys` (None si ninguna)."""
+    for k in keys:
+        if k in d:
+            return d[k]
+    return None
+
+
+_STAGES_KEYS = ("STAGES", "stages")
+_JOBS_KEYS = ("JOBS", "jobs")
+
+
+def _job_mode_key(job: Dict[str, Any]) -> Any:
+    """Clave con la que el job declara su MODE ('mode' o 'MODE'), o None."""
+    return "mode" if "mode" in job else ("MODE" if "MODE" in job else None)
+
+
 def _normalize_job_modes(workout_dict: Dict[str, Any]) -> None:
     """
     Normaliza el MODE de cada job a su token canónico (minúsculas) in place,
-    ANTES de validar. Los MODE desconocidos se dejan intactos: la validación
-    por-MODE los rechazará después con un mensaje claro.
+    ANTES de validar. Un MODE string desconocido corta aquí mismo (fail-fast),
+    sin pagar la validación top-level ni la de los jobs anteriores.
     """
-    stages = workout_dict.get("STAGES") or workout_dict.get("stages") or []
+    stages = _first(workout_dict, _STAGES_KEYS) or []
     if not isinstance(stages, list):
         return
-    for stage in stages:
+    for s_idx, stage in enumerate(stages, start=1):
         if not isinstance(stage, dict):
             continue
-        jobs = stage.get("JOBS") or stage.get("jobs") or []
+        jobs = _first(stage, _JOBS_KEYS) or []
         if not isinstance(jobs, list):
             continue
-        for job in jobs:
+        for j_idx, job in enumerate(jobs, start=1):
             if not isinstance(job, dict):
                 continue
-            mkey = "mode" if "mode" in job else ("MODE" if "MODE" in job else None)
+            mkey = _job_mode_key(job)
             if mkey is None:
                 continue
             raw_mode = job.get(mkey)
             if isinstance(raw_mode, str):
                 canon = MODE_SYNONYMS.get(raw_mode.strip().lower())
-                if canon:
-                    job[mkey] = canon
+                if canon is None:
+                    raise SchemaValidationError(
+                        f"Stage {s_idx}, job {j_idx}: unsupported MODE {raw_mode!r} "
+                        f"for job schema validation"
+                    )
+                job[mkey] = canon
 
 
 def _validate_jobs_against_mode_schemas(
@@ -177,7 +244,7 @@ def _validate_jobs_against_mode_schemas(
     Recorre STAGES/JOBS de un workout dict y valida cada job contra
     su JSON Schema específico según MODE.
     """
-    stages = workout_dict.get("STAGES") or workout_dict.get("stages") or []
+    stages = _first(workout_dict, _STAGES_KEYS) or []
     if not isinstance(stages, list):
         # Esto ya debería estar controlado por workout.schema.json,
         # pero por si acaso.
@@ -189,7 +256,7 @@ def _validate_jobs_against_mode_schemas(
                 f"Stage {s_idx}: stage must be an object for job validation"
             )
 
-        jobs = stage.get("JOBS") or stage.get("jobs") or []
+        jobs = _first(stage, _JOBS_KEYS) or []
         if not isinstance(jobs, list):
             raise SchemaValidationError(
                 f"Stage {s_idx}: JOBS must be a list for job validation"
@@ -201,17 +268,17 @@ def _validate_jobs_against_mode_schemas(
                     f"Stage {s_idx}, job {j_idx}: job must be an object"
                 )
 
-            mode_raw = job.get("mode")
-            if not isinstance(mode_raw, str):
-                mode_raw = job.get("MODE")
+            mkey = _job_mode_key(job)
+            mode_raw = job.get(mkey) if mkey is not None else None
             if not isinstance(mode_raw, str):
                 raise SchemaValidationError(
                     f"Stage {s_idx}, job {j_idx}: mode must be a string "
                     f"for job schema validation"
                 )
 
-            mode_key = mode_raw.strip().lower()
-            schema_filename = JOB_MODE_SCHEMAS.get(mode_key)
+            # _normalize_job_modes ya dejó en esta misma clave el token
+            # canónico: un único lookup directo, sin volver a normalizar.
+            schema_filename = JOB_MODE_SCHEMAS.get(mode_raw)
             if not schema_filename:
                 raise SchemaValidationError(
                     f"Stage {s_idx}, job {j_idx}: unsupported MODE {mode_raw!r} "
@@ -232,13 +299,18 @@ def _validate_jobs_against_mode_schemas(
 # ---------------------------------------------------------------------------
 
 
-def load_workout_v2(path: Path, schema_root: Path) -> Dict[str, Any]:
+def load_workout_v2(
+    path: Path, schema_root: Path, *, validate: bool = True
+) -> Dict[str, Any]:
     """
     Carga un workout YAML como dict y lo valida en dos pasos:
 
     1. Contra workout.schema.json (estructura global: NAME, STAGES, etc.)
     2. Cada JOB contra su schema específico según MODE (custom_sets, TABATA, EMOM, ...)
 
+    Con validate=False (ficheros ya validados, p.ej. al recargar la
+    biblioteca) solo se parsea y se normaliza MODE: se omiten ambos pasos.
+
     De momento devuelve el dict "crudo" ya validado. La capa de dominio v2
     construirá las dataclasses encima.
     """
@@ -252,6 +324,9 @@ def load_workout_v2(path: Path, schema_root: Path) -> Dict[str, Any]:
     # 0) Normalización de MODE (vocabulario único) ANTES de validar
     _normalize_job_modes(workout_dict)
 
+    if not validate:
+        return workout_dict
+
     # 1) Validación top-level
     workout_schema_path = schema_root / "workout.schema.json"
     validate_instance_against_schema(
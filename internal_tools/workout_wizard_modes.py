@@ -152,6 +152,13 @@ EXERCISE_LIBRARY = [
     "Bench Press",
 ]
 
+# Menús invariantes: se construyen una sola vez y se imprimen de golpe.
+_EX_LIB_MENU = "\n".join(f"  {i}) {n}" for i, n in enumerate(EXERCISE_LIBRARY, 1))
+_MODE_MENU = "\n".join(f"  {i}) {k}" for i, k in enumerate(MODE_SCHEMAS, 1))
+_MODE_LABELS_MENU = "\n".join(
+    f"  - {k}: {v.get('label', '')}" for k, v in MODE_SCHEMAS.items()
+)
+
 
 # =========================
 # Helpers
@@ -192,10 +199,15 @@ def yes_no(prompt: str, default: bool = True) -> bool:
         print("Responde 'y' o 'n'.")
 
 
-def choose_from_list(prompt: str, options: List[str]) -> str:
+def choose_from_list(
+    prompt: str, options: List[str], prebuilt_menu: Optional[str] = None
+) -> str:
     print(prompt)
-    for idx, opt in enumerate(options, start=1):
-        print(f"  {idx}) {opt}")
+    if prebuilt_menu is not None:
+        print(prebuilt_menu)
+    else:
+        for idx, opt in enumerate(options, start=1):
+            print(f"  {idx}) {opt}")
     while True:
         raw = input("Opción: ").strip()
         if raw == "" and options:
@@ -251,8 +263,7 @@ def ask_typed(field_conf: Dict[str, Any]) -> Any:
 def ask_exercise() -> Exercise:
     print("\n--- Nuevo ejercicio ---")
     print("Elige de la lista o deja vacío para escribir a mano.")
-    for idx, ex in enumerate(EXERCISE_LIBRARY, start=1):
-        print(f"  {idx}) {ex}")
+    print(_EX_LIB_MENU)
     raw = input("Número de ejercicio (o vacío para custom): ").strip()
     if raw.isdigit():
         idx = int(raw)
@@ -281,9 +292,8 @@ def ask_job(job_index: int) -> Job:
 
     mode_keys = list(MODE_SCHEMAS.keys())
     print("\nTipos de MODE disponibles:")
-    for k, v in MODE_SCHEMAS.items():
-        print(f"  - {k}: {v.get('label', '')}")
-    mode = choose_from_list("Elige MODE", mode_keys)
+    print(_MODE_LABELS_MENU)
+    mode = choose_from_list("Elige MODE", mode_keys, prebuilt_menu=_MODE_MENU)
 
     desc = ask("Descripción del JOB", default="")
 
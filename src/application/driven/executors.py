@@ -16,7 +16,7 @@ edt (densidad), custom_sets guiado.
 """
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 
 from src.domain_v2.workout_v2 import JobV2, JobModeV2
 from src.application.driven.segments import Segment
@@ -336,6 +336,27 @@ def _ladder_segments(job: JobV2) -> List[Segment]:
     return segs
 
 
+def _emom_or_death_by_segments(job: JobV2) -> Optional[List[Segment]]:
+    if job.death_by is not None:
+        return None  # lo maneja _drive_death_by en el player
+    return _emom_segments(job)
+
+
+# MODE -> executor. Un único lookup por job; añadir un modo driven es
+# registrar aquí su función.
+_EXECUTORS: Dict[JobModeV2, Callable[[JobV2], Optional[List[Segment]]]] = {
+    JobModeV2.INTERVAL: _interval_segments,
+    JobModeV2.TABATA: _interval_segments,
+    JobModeV2.AMRAP: _amrap_segments,
+    JobModeV2.FOR_TIME: _for_time_segments,
+    JobModeV2.EMOM: _emom_or_death_by_segments,
+    JobModeV2.EDT: _edt_segments,
+    JobModeV2.CUSTOM_SETS: _custom_sets_segments,
+    JobModeV2.CARRY: _carry_segments,
+    JobModeV2.LADDER: _ladder_segments,
+}
+
+
 def build_segments(job: JobV2) -> Optional[List[Segment]]:
     """Secuencia de segmentos cronometrados para un job.
 
@@ -343,22 +364,5 @@ def build_segments(job: JobV2) -> Optional[List[Segment]]:
     puede entonces caer al modo descriptivo). Death-By (emom) también devuelve
     None: lo conduce un flujo dedicado en el player (intervalos hasta el fallo).
     """
-    if job.mode in (JobModeV2.INTERVAL, JobModeV2.TABATA):
-        return _interval_segments(job)
-    if job.mode is JobModeV2.AMRAP:
-        return _amrap_segments(job)
-    if job.mode is JobModeV2.FOR_TIME:
-        return _for_time_segments(job)
-    if job.mode is JobModeV2.EMOM:
-        if job.death_by is not None:
-            return None  # lo maneja _drive_death_by en el player
-        return _emom_segments(job)
-    if job.mode is JobModeV2.EDT:
-        return _edt_segments(job)
-    if job.mode is JobModeV2.CUSTOM_SETS:
-        return _custom_sets_segments(job)
-    if job.mode is JobModeV2.CARRY:
-        return _carry_segments(job)
-    if job.mode is JobModeV2.LADDER:
-        return _ladder_segments(job)
-    return None
+    executor = _EXECUTORS.get(job.mode)
+    return executor(job) if executor is not None else None
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Segment:
     """Un tramo de tiempo con un significado.
 
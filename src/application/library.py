@@ -13,6 +13,11 @@ from typing import Optional, Tuple
 
 import yaml
 
+try:  # libyaml (C) para los listados que releen toda la biblioteca
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML sin libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 from src.application.workout_loader import (
     load_workout_v2_model_from_file,
     WorkoutLoadError,
@@ -35,7 +40,7 @@ def library_files() -> list[Path]:
 def peek_name(path: Path) -> str:
     """Lee solo el 'name' del YAML sin validar (para listados rápidos)."""
     try:
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+        data = yaml.load(path.read_text(encoding="utf-8"), Loader=_YamlLoader)
         if isinstance(data, dict):
             name = data.get("name") or data.get("NAME")
             if name:
@@ -102,7 +107,8 @@ def import_workout(src_path: Path) -> Tuple[Path, bool]:
     # Extraer stages y jobs a la biblioteca de componentes (para reutilizarlos).
     try:
         from src.application import components
-        raw = yaml.safe_load(dest.read_text(encoding="utf-8"))
+        # YAML crudo (no el dict normalizado), igual que rebuild_from_library.
+        raw = yaml.load(dest.read_text(encoding="utf-8"), Loader=_YamlLoader)
         components.save_components_from_workout(raw)
     except Exception:
         pass
@@ -127,7 +133,7 @@ def workouts_by_tag(tags: list[str]) -> list[Tuple[Path, str]]:
         return out
     for f in library_files():
         try:
-            data = yaml.safe_load(f.read_text(encoding="utf-8"))
+            data = yaml.load(f.read_text(encoding="utf-8"), Loader=_YamlLoader)
         except Exception:
             continue
         if not isinstance(data, dict):
@@ -1,9 +1,13 @@
 # src/application/workout_loader.py
 from __future__ import annotations
 
+import copy
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 from internal_tools.schema_loader_v2 import (
     load_workout_v2 as _load_workout_v2,
@@ -14,21 +18,51 @@ from src.domain_v2.workout_v2 import WorkoutV2
 log = logging.getLogger(__name__)
 
 
+# Caché LRU de dicts ya validados, indexada por (hash del contenido YAML,
+# schema_root, mtimes de los schemas, validate): recargar el mismo fichero
+# (CLI, web, tests) no vuelve a parsear ni validar; editar un schema invalida
+# las entradas validadas con el anterior. Se cachea el dict y no el modelo:
+# WorkoutV2 es mutable (tags, extra, mini_sets...), así que cada llamada
+# construye su propia instancia a partir de una copia profunda.
+_MODEL_CACHE_MAXSIZE = 128
+_model_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+# FastAPI ejecuta los endpoints síncronos en un threadpool: get/move_to_end/
+# popitem deben ser atómicos frente a evicciones concurrentes.
+_model_cache_lock = threading.Lock()
+
+
+def _schema_stamp(schema_root: Path) -> Tuple[int, ...]:
+    """mtimes (ns) de los *.schema.json de schema_root, en orden de nombre."""
+    return tuple(
+        p.stat().st_mtime_ns for p in sorted(schema_root.glob("*.schema.json"))
+    )
+
+
+def clear_model_cache() -> None:
+    """Vacía la caché de workouts validados (tests, recargas en caliente)."""
+    with _model_cache_lock:
+        _model_cache.clear()
+
+
 class WorkoutLoadError(Exception):
     """Error de alto nivel para la carga de workouts (CLI, etc.)."""
     pass
 
 
-def load_workout_v2_from_file(path: Path, schema_root: Path) -> Dict[str, Any]:
+def load_workout_v2_from_file(
+    path: Path, schema_root: Path, *, validate: bool = True
+) -> Dict[str, Any]:
     """
     Loader v2 (única vía):
       - Normaliza el vocabulario de MODE y valida el workout contra los
         JSON Schemas (estructura global + cada job por su MODE).
       - Devuelve el dict ya validado.
+
+    validate=False es opt-in para ficheros ya validados: omite los JSON Schemas.
     """
     log.info("Loading workout (v2) from file: %s", path)
     try:
-        data = _load_workout_v2(path=path, schema_root=schema_root)
+        data = _load_workout_v2(path=path, schema_root=schema_root, validate=validate)
     except SchemaValidationError as exc:
         msg = f"Workout in {path} is invalid according to JSON Schemas: {exc}"
         log.error(msg)
@@ -36,9 +70,48 @@ def load_workout_v2_from_file(path: Path, schema_root: Path) -> Dict[str, Any]:
     return data
 
 
-def load_workout_v2_model_from_file(path: Path, schema_root: Path) -> WorkoutV2:
+def load_workout_v2_model_from_file(
+    path: Path, schema_root: Path, *, validate: bool = True
+) -> WorkoutV2:
     """
     Valida el YAML y construye el modelo de dominio tipado WorkoutV2.
+
+    El dict validado se cachea por contenido: un fichero idéntico no repite
+    parseo ni validación. Cada llamada devuelve una instancia nueva.
     """
-    data = load_workout_v2_from_file(path=path, schema_root=schema_root)
-    return WorkoutV2.from_dict(data)
+    try:
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        stamp = _schema_stamp(schema_root)
+    except OSError:
+        digest = None  # el loader reportará el error de lectura
+
+    key = (
+        (digest, str(schema_root), stamp, validate) if digest is not None else None
+    )
+    cached = None
+    if key is not None:
+        with _model_cache_lock:
+            cached = _model_cache.get(key)
+            if cached is not None:
+                _model_cache.move_to_end(key)
+
+    if cached is None:
+        cached = load_workout_v2_from_file(
+            path=path, schema_root=schema_root, validate=validate
+        )
+        if key is not None:
+            with _model_cache_lock:
+                _model_cache[key] = cached
+                if len(_model_cache) > _MODEL_CACHE_MAXSIZE:
+                    _model_cache.popitem(last=False)
+
+    # El dict cacheado nunca sale de aquí: el modelo se construye sobre una
+    # copia para que ninguna instancia comparta listas/dicts con la caché.
+    try:
+        return WorkoutV2.from_dict(copy.deepcopy(cached))
+    except (ValueError, TypeError, KeyError, AttributeError) as exc:
+        # Con validate=False los schemas no filtran nada: un dict incompleto
+        # (p.ej. un job sin MODE) acaba aquí y debe respetar el contrato.
+        msg = f"Workout in {path} could not be built: {exc}"
+        log.error(msg)
+        raise WorkoutLoadError(msg) from exc
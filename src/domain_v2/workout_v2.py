@@ -1,18 +1,103 @@
 # src/domain_v2/workout_v2.py
 from __future__ import annotations
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 def _as_tags(v: Any) -> List[str]:
     """Normaliza 'tags' a lista de strings (tolera un string suelto o None)."""
     if isinstance(v, list):
-        return [str(x).strip() for x in v if str(x).strip()]
-    if isinstance(v, str) and v.strip():
-        return [v.strip()]
+        return [s for x in v if (s := str(x).strip())]
+    if type(v) is str and (s := v.strip()):
+        return [s]
     return []
 
+
+# Alias aceptados en el YAML para cada campo (grafía v1 / v2), por prioridad.
+_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "name": ("NAME", "name"),
+    "mode": ("mode", "MODE"),
+    "rounds": ("Rounds", "rounds"),
+    "work_time_in_seconds": ("work_time_in_seconds",),
+    "work_time_in_minutes": ("work_time_in_minutes",),
+    "interval_in_seconds": ("interval_in_seconds",),
+    "rest_time_in_seconds": ("rest_time_in_seconds",),
+    "rest_between_exercises_in_seconds": (
+        "Rest_between_exercises_in_seconds",
+        "rest_between_exercises_in_seconds",
+    ),
+    "rest_between_rounds_in_seconds": (
+        "Rest_between_rounds_in_seconds",
+        "rest_between_rounds_in_seconds",
+    ),
+    "cadence": ("cadence", "Cadence"),
+    "tempo": ("tempo", "Tempo"),
+    "eccentric_neg": ("Eccentric (NEG)", "eccentric_neg"),
+    "isometric_hold": ("isometric (HOLD)", "Isometric (HOLD)", "isometric_hold"),
+    "exercises": ("EXERCISES", "Exercises", "exercises"),
+    "jobs": ("JOBS", "jobs"),
+    "stages": ("STAGES", "stages"),
+}
+
+
+def _get(data: Dict[str, Any], field_name: str) -> Any:
+    """Valor del primer alias PRESENTE de `field_name` (None si ninguno).
+
+    A diferencia de `data.get(a) or data.get(b)`, respeta valores falsy
+    válidos (0, False, "") y deja de buscar en cuanto encuentra la clave.
+    """
+    for key in _ALIASES[field_name]:
+        if key in data:
+            return data[key]
+    return None
+
+
+# Prioridad de la descripción por entidad: el job prefiere `description`;
+# stage y workout, `Description` (primer valor no vacío, como en v1).
+_JOB_DESCRIPTION_KEYS = ("description", "Description")
+_DESCRIPTION_KEYS = ("Description", "description")
+
+
+def _name_and_description(
+    data: Dict[str, Any], desc_keys: Tuple[str, str] = _DESCRIPTION_KEYS
+) -> Tuple[str, Optional[str]]:
+    """NAME (internado) y description (strip, o None) comunes a job/stage/workout."""
+    name = sys.intern(str(_get(data, "name")).strip())
+    first, second = desc_keys
+    desc_raw = data.get(first) or data.get(second)
+    return name, (desc_raw.strip() if type(desc_raw) is str else None)
+
+
+def _as_float(v: Any) -> Optional[float]:
+    """Casting ligero a float de un valor numérico (None si no lo es; bool no cuenta)."""
+    t = type(v)
+    return float(v) if t is float or t is int else None
+
+
+def _as_int(v: Any) -> Optional[int]:
+    """Entero del YAML (None si no lo es). `type() is int` deja fuera a bool;
+    un float integral (30.0, que el schema acepta como integer) se convierte."""
+    if type(v) is int:
+        return v
+    if type(v) is float and v.is_integer():
+        return int(v)
+    return None
+
+
+_TRUTHY = frozenset({"true", "yes", "1", "t", "y"})
+
+
+def _as_bool(v: Any) -> bool:
+    """Flag booleano del YAML: bool tal cual, string si está en _TRUTHY."""
+    if type(v) is bool:
+        return v
+    if type(v) is str:
+        return v.strip().casefold() in _TRUTHY
+    return False
+
+
 class JobModeV2(str, Enum):
     CUSTOM_SETS = "CUSTOM"
     TABATA = "TABATA"
@@ -25,29 +110,16 @@ class JobModeV2(str, Enum):
     CARRY = "CARRY"
 
     @classmethod
-    def from_raw(cls, raw: str) -> "JobModeV2":
-        s = str(raw).strip()
-        lower = s.lower()
-        if lower in {"custom_sets", "custom"}:
-            return cls.CUSTOM_SETS
-        if lower == "tabata":
-            return cls.TABATA
-        if lower == "emom":
-            return cls.EMOM
-        if lower == "amrap":
-            return cls.AMRAP
-        if lower == "for_time":
-            return cls.FOR_TIME
-        if lower == "edt":
-            return cls.EDT
-        if lower in {"super_sets", "supersets"}:
-            return cls.CUSTOM_SETS
-        if lower == "ladder":
-            return cls.LADDER
-        if lower in {"interval", "hiit"}:
-            return cls.INTERVAL
-        if lower in {"carry", "hold", "carries", "loaded_carry", "farmers_walk"}:
-            return cls.CARRY
+    def from_raw(cls, raw: Any) -> "JobModeV2":
+        # El loader ya deja el token canónico: casi siempre basta un lookup
+        # directo, sin strip/lower por job. Un MODE ausente o no-string se
+        # rechaza tal cual (antes acababa como el literal "None").
+        if type(raw) is str:
+            mode = _MODE_BY_TOKEN.get(raw)
+            if mode is None:
+                mode = _MODE_BY_TOKEN.get(raw.strip().lower())
+            if mode is not None:
+                return mode
         # El schema ya debería haber filtrado esto
         raise ValueError(f"Unsupported MODE in v2: {raw!r}")
 
@@ -55,85 +127,96 @@ class JobModeV2(str, Enum):
         """
         Etiqueta corta y consistente para mostrar el modo.
         """
-        if self is JobModeV2.CUSTOM_SETS:
-            return "CUSTOM"
-        if self is JobModeV2.TABATA:
-            return "TABATA"
-        if self is JobModeV2.EMOM:
-            return "EMOM"
-        if self is JobModeV2.AMRAP:
-            return "AMRAP"
-        if self is JobModeV2.FOR_TIME:
-            return "FT"
-        if self is JobModeV2.EDT:
-            return "EDT"
-        if self is JobModeV2.LADDER:
-            return "LADDER"
-        if self is JobModeV2.INTERVAL:
-            return "INTERVAL"
-        if self is JobModeV2.CARRY:
-            return "CARRY/HOLD"
-        return str(self.value)
+        return _MODE_LABELS.get(self, str(self.value))
 
     def mode_description(self) -> str:
         """
         Descripción fija del tipo de trabajo (MODO), no del job concreto.
         Esto es lo que mostraremos en el preview y en el runner antes de cada job.
         """
-        if self is JobModeV2.CUSTOM_SETS:
-            return (
-                "CUSTOM: Bloques de ejercicios encadenados (supersets/giant sets). "
-                "Se ejecutan las rondas definidas respetando descansos y/o cadencia."
-            )
-        if self is JobModeV2.TABATA:
-            return (
-                "TABATA: Intervalos cortos de alta intensidad, típicamente 20s ON / 10s OFF "
-                "durante varias rondas."
-            )
-        if self is JobModeV2.EMOM:
-            return (
-                "EMOM: Every Minute On the Minute. Realiza el trabajo al inicio de cada minuto, "
-                "descansando el resto del tiempo."
-            )
-        if self is JobModeV2.AMRAP:
-            return (
-                "AMRAP: As Many Rounds/Reps As Possible dentro de una ventana de tiempo fija."
-            )
-        if self is JobModeV2.FOR_TIME:
-            return (
-                "FOR TIME: Completa todas las reps indicadas lo más rápido posible. "
-                "El tiempo total es la métrica principal."
-            )
-        if self is JobModeV2.EDT:
-            return (
-                "EDT: Escalating Density Training. Trabaja por bloques de tiempo fijos, "
-                "acumulando el máximo volumen posible en uno o dos ejercicios."
-            )
-        if self is JobModeV2.LADDER:
-            return (
-                "LADDER: Escalera de repeticiones. Sube o baja las reps en cada ronda "
-                "segun el incremento definido (ascendente o descendente)."
-            )
-        if self is JobModeV2.INTERVAL:
-            return (
-                "INTERVAL: Bloques de trabajo/descanso repetidos (HIIT). "
-                "Tabata es un preset (20s/10s x8)."
-            )
-        if self is JobModeV2.CARRY:
-            return (
-                "CARRY/HOLD: Acarreos y sostenidos cargados. La prescripción se "
-                "mide por distancia (m) o por tiempo (s), normalmente con peso "
-                "(farmer's walk, yoke, sled, plancha, dead hang)."
-            )
-        return ""
+        return _MODE_DESCRIPTIONS.get(self, "")
+
+
+# Etiqueta corta de cada MODO (ver JobModeV2.mode_label).
+_MODE_LABELS: Dict[JobModeV2, str] = {
+    JobModeV2.CUSTOM_SETS: "CUSTOM",
+    JobModeV2.TABATA: "TABATA",
+    JobModeV2.EMOM: "EMOM",
+    JobModeV2.AMRAP: "AMRAP",
+    JobModeV2.FOR_TIME: "FT",
+    JobModeV2.EDT: "EDT",
+    JobModeV2.LADDER: "LADDER",
+    JobModeV2.INTERVAL: "INTERVAL",
+    JobModeV2.CARRY: "CARRY/HOLD",
+}
+
+# Descripción fija de cada MODO (ver JobModeV2.mode_description).
+_MODE_DESCRIPTIONS: Dict[JobModeV2, str] = {
+    JobModeV2.CUSTOM_SETS: (
+        "CUSTOM: Bloques de ejercicios encadenados (supersets/giant sets). "
+        "Se ejecutan las rondas definidas respetando descansos y/o cadencia."
+    ),
+    JobModeV2.TABATA: (
+        "TABATA: Intervalos cortos de alta intensidad, típicamente 20s ON / 10s OFF "
+        "durante varias rondas."
+    ),
+    JobModeV2.EMOM: (
+        "EMOM: Every Minute On the Minute. Realiza el trabajo al inicio de cada minuto, "
+        "descansando el resto del tiempo."
+    ),
+    JobModeV2.AMRAP: (
+        "AMRAP: As Many Rounds/Reps As Possible dentro de una ventana de tiempo fija."
+    ),
+    JobModeV2.FOR_TIME: (
+        "FOR TIME: Completa todas las reps indicadas lo más rápido posible. "
+        "El tiempo total es la métrica principal."
+    ),
+    JobModeV2.EDT: (
+        "EDT: Escalating Density Training. Trabaja por bloques de tiempo fijos, "
+        "acumulando el máximo volumen posible en uno o dos ejercicios."
+    ),
+    JobModeV2.LADDER: (
+        "LADDER: Escalera de repeticiones. Sube o baja las reps en cada ronda "
+        "segun el incremento definido (ascendente o descendente)."
+    ),
+    JobModeV2.INTERVAL: (
+        "INTERVAL: Bloques de trabajo/descanso repetidos (HIIT). "
+        "Tabata es un preset (20s/10s x8)."
+    ),
+    JobModeV2.CARRY: (
+        "CARRY/HOLD: Acarreos y sostenidos cargados. La prescripción se "
+        "mide por distancia (m) o por tiempo (s), normalmente con peso "
+        "(farmer's walk, yoke, sled, plancha, dead hang)."
+    ),
+}
+
+# Token de MODE (en minúsculas) -> JobModeV2. Lookup O(1) en from_raw.
+_MODE_BY_TOKEN: Dict[str, JobModeV2] = {
+    "custom_sets": JobModeV2.CUSTOM_SETS,
+    "custom": JobModeV2.CUSTOM_SETS,
+    "super_sets": JobModeV2.CUSTOM_SETS,
+    "supersets": JobModeV2.CUSTOM_SETS,
+    "tabata": JobModeV2.TABATA,
+    "emom": JobModeV2.EMOM,
+    "amrap": JobModeV2.AMRAP,
+    "for_time": JobModeV2.FOR_TIME,
+    "edt": JobModeV2.EDT,
+    "ladder": JobModeV2.LADDER,
+    "interval": JobModeV2.INTERVAL,
+    "hiit": JobModeV2.INTERVAL,
+    "carry": JobModeV2.CARRY,
+    "hold": JobModeV2.CARRY,
+    "carries": JobModeV2.CARRY,
+    "loaded_carry": JobModeV2.CARRY,
+    "farmers_walk": JobModeV2.CARRY,
+}
 
 
 # -------------------------------------------------------------------
 # SetPrescriptionV2
 # -------------------------------------------------------------------
 
-
-@dataclass
+@dataclass(slots=True)
 class SetPrescriptionV2:
     """Prescripción de UNA serie concreta.
 
@@ -149,16 +232,12 @@ class SetPrescriptionV2:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SetPrescriptionV2":
-        def _f(key: str) -> Optional[float]:
-            v = data.get(key)
-            return float(v) if isinstance(v, (int, float)) else None
-
         return cls(
-            reps=data.get("reps"),
-            work_time_in_seconds=data.get("work_time_in_seconds"),
-            weight=_f("weight"),
-            percent_1rm=_f("percent_1rm"),
-            rpe=_f("rpe"),
+            reps=_as_int(data.get("reps")),
+            work_time_in_seconds=_as_int(data.get("work_time_in_seconds")),
+            weight=_as_float(data.get("weight")),
+            percent_1rm=_as_float(data.get("percent_1rm")),
+            rpe=_as_float(data.get("rpe")),
         )
 
 
@@ -167,7 +246,7 @@ class SetPrescriptionV2:
 # -------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class IntraSetV2:
     """Técnica intra-serie: cluster, rest-pause, myo-reps o drop set.
 
@@ -184,11 +263,11 @@ class IntraSetV2:
     def from_dict(cls, data: Dict[str, Any]) -> "IntraSetV2":
         t = str(data.get("type") or "").strip().lower()
         rest = data.get("rest_seconds")
-        mini = [x for x in (data.get("mini_sets") or []) if isinstance(x, int)]
+        mini = [x for x in (data.get("mini_sets") or []) if type(x) is int]
         drops = [d for d in (data.get("drops") or []) if isinstance(d, dict)]
         return cls(
             type=t,
-            rest_seconds=rest if isinstance(rest, int) else None,
+            rest_seconds=rest if type(rest) is int else None,
             mini_sets=mini,
             drops=drops,
         )
@@ -198,8 +277,31 @@ class IntraSetV2:
 # ExerciseV2
 # -------------------------------------------------------------------
 
-
-@dataclass
+# Alias aceptados para las notas del ejercicio, por orden de prioridad.
+_EXERCISE_NOTES_KEYS = ("notes", "note", "DESCRIPTION", "Description", "description")
+
+# Claves que ExerciseV2 consume; el resto va a `extra`.
+_EXERCISE_CORE_KEYS = frozenset({
+    "NAME",
+    "name",
+    "reps",
+    "work_time_in_seconds",
+    "distance_in_meters",
+    "weight",
+    "percent_1rm",
+    "rpe",
+    "sets",
+    "intra_set",
+    "notes",
+    "note",
+    "DESCRIPTION",
+    "Description",
+    "description",
+    "help",
+})
+
+
+@dataclass(slots=True)
 class ExerciseV2:
     name: str
 
@@ -213,7 +315,7 @@ class ExerciseV2:
     notes: Optional[str] = None
     help: Optional[str] = None
 
-    sets: List[SetPrescriptionV2] = field(default_factory=list)
+    sets: Tuple[SetPrescriptionV2, ...] = ()
     intra_set: Optional["IntraSetV2"] = None
     extra: Dict[str, Any] = field(default_factory=dict)
 
@@ -223,73 +325,40 @@ class ExerciseV2:
         Construye ExerciseV2 asumiendo que `data` ya está validado por JSON Schema.
         No se hace validación fuerte, solo casting ligero y extracción de campos.
         """
-        name = str(data.get("NAME") or data.get("name")).strip()
+        name = sys.intern(str(_get(data, "name")).strip())
 
-        reps = data.get("reps")
-        work_time_in_seconds = data.get("work_time_in_seconds")
-
-        distance_in_meters = data.get("distance_in_meters")
-        if isinstance(distance_in_meters, (int, float)):
-            distance_in_meters = float(distance_in_meters)
-        else:
-            distance_in_meters = None
+        reps = _as_int(data.get("reps"))
+        work_time_in_seconds = _as_int(data.get("work_time_in_seconds"))
 
-        weight = data.get("weight")
-
-        if isinstance(weight, (int, float)):
-            weight = float(weight)
-        else:
-            weight = None
-
-        def _f(key: str) -> Optional[float]:
-            v = data.get(key)
-            return float(v) if isinstance(v, (int, float)) else None
-
-        percent_1rm = _f("percent_1rm")
-        rpe = _f("rpe")
+        distance_in_meters = _as_float(data.get("distance_in_meters"))
+        weight = _as_float(data.get("weight"))
+        percent_1rm = _as_float(data.get("percent_1rm"))
+        rpe = _as_float(data.get("rpe"))
 
         sets_raw = data.get("sets") or []
-        sets = [
+        sets = tuple([
             SetPrescriptionV2.from_dict(s)
             for s in sets_raw
             if isinstance(s, dict)
-        ]
+        ])
 
         intra_raw = data.get("intra_set")
         intra_set = IntraSetV2.from_dict(intra_raw) if isinstance(intra_raw, dict) else None
 
         notes = None
-        for key in ("notes", "note", "DESCRIPTION", "Description", "description"):
+        for key in _EXERCISE_NOTES_KEYS:
             val = data.get(key)
-            if isinstance(val, str):
+            if type(val) is str:
                 notes = val.strip()
                 break
 
         help_text = data.get("help")
-        if isinstance(help_text, str):
+        if type(help_text) is str:
             help_text = help_text.strip()
         else:
             help_text = None
 
-        core_keys = {
-            "NAME",
-            "name",
-            "reps",
-            "work_time_in_seconds",
-            "distance_in_meters",
-            "weight",
-            "percent_1rm",
-            "rpe",
-            "sets",
-            "intra_set",
-            "notes",
-            "note",
-            "DESCRIPTION",
-            "Description",
-            "description",
-            "help",
-        }
-        extra = {k: v for k, v in data.items() if k not in core_keys}
+        extra = {k: v for k, v in data.items() if k not in _EXERCISE_CORE_KEYS}
 
         return cls(
             name=name,
@@ -312,7 +381,7 @@ class ExerciseV2:
 # -------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class DeathBySpecV2:
     """Variante Death-By de EMOM: las reps ascienden cada intervalo hasta el fallo.
 
@@ -325,7 +394,7 @@ class DeathBySpecV2:
     def from_dict(cls, data: Any) -> "DeathBySpecV2":
         if isinstance(data, dict):
             inc = data.get("increment_by")
-            if isinstance(inc, int) and inc != 0:
+            if type(inc) is int and inc != 0:
                 return cls(increment_by=inc)
         return cls()
 
@@ -334,8 +403,54 @@ class DeathBySpecV2:
 # JobV2
 # -------------------------------------------------------------------
 
-
-@dataclass
+# Claves que JobV2 consume; el resto va a `extra`.
+_JOB_CORE_KEYS = frozenset({
+    "NAME",
+    "name",
+    "MODE",
+    "mode",
+    "description",
+    "Description",
+    "tags",
+    "Rounds",
+    "rounds",
+    "work_time_in_seconds",
+    "work_time_in_minutes",
+    "interval_in_seconds",
+    "rest_time_in_seconds",
+    "Rest_between_exercises_in_seconds",
+    "rest_between_exercises_in_seconds",
+    "Rest_between_rounds_in_seconds",
+    "rest_between_rounds_in_seconds",
+    "cadence",
+    "Cadence",
+    "tempo",
+    "Tempo",
+    "Eccentric (NEG)",
+    "eccentric_neg",
+    "isometric (HOLD)",
+    "Isometric (HOLD)",
+    "isometric_hold",
+    "death_by",
+    "EXERCISES",
+    "Exercises",
+    "exercises",
+})
+
+# Campos enteros del job: (atributo, solo_positivo). Se leen con `_get`
+# (alias en _ALIASES) y se castean con `_as_int` en un único bucle.
+_JOB_INT_FIELDS: Tuple[Tuple[str, bool], ...] = (
+    ("rounds", True),
+    ("work_time_in_seconds", False),
+    ("work_time_in_minutes", False),
+    ("interval_in_seconds", False),
+    ("rest_time_in_seconds", False),
+    ("rest_between_exercises_in_seconds", False),
+    ("rest_between_rounds_in_seconds", False),
+)
+
+
+@dataclass(slots=True)
 class JobV2:
     name: str
     mode: JobModeV2
@@ -358,7 +473,7 @@ class JobV2:
     isometric_hold: bool = False
     death_by: Optional[DeathBySpecV2] = None
 
-    exercises: List[ExerciseV2] = field(default_factory=list)
+    exercises: Tuple[ExerciseV2, ...] = ()
     extra: Dict[str, Any] = field(default_factory=dict)
 
     @classmethod
@@ -369,57 +484,26 @@ class JobV2:
         Aquí no lanzamos errores "de usuario": si algo viene raro es bug,
         no input error (la validación ya se hizo antes).
         """
-        name = str(data.get("NAME") or data.get("name")).strip()
-        mode = JobModeV2.from_raw(str(data.get("mode") or data.get("MODE")))
-
-        desc_raw = data.get("description") or data.get("Description")
-        description = desc_raw.strip() if isinstance(desc_raw, str) else None
+        name, description = _name_and_description(data, _JOB_DESCRIPTION_KEYS)
+        mode = JobModeV2.from_raw(_get(data, "mode"))
 
         tags = _as_tags(data.get("tags"))
 
-        rounds = data.get("Rounds") if "Rounds" in data else data.get("rounds")
-        if isinstance(rounds, int) and rounds <= 0:
-            rounds = None  # schema no debería permitirlo, fallback defensivo
-
-        work_time_in_seconds = data.get("work_time_in_seconds")
-        work_time_in_minutes = data.get("work_time_in_minutes")
-        interval_in_seconds = data.get("interval_in_seconds")
-
-        rest_time_in_seconds = data.get("rest_time_in_seconds")
-        rest_between_exercises_in_seconds = (
-            data.get("Rest_between_exercises_in_seconds")
-            or data.get("rest_between_exercises_in_seconds")
-        )
-        rest_between_rounds_in_seconds = (
-            data.get("Rest_between_rounds_in_seconds")
-            or data.get("rest_between_rounds_in_seconds")
-        )
-
-        cad_raw = data.get("cadence") or data.get("Cadence")
-        cadence = cad_raw.strip() if isinstance(cad_raw, str) else None
+        ints: Dict[str, Optional[int]] = {}
+        for attr, positive_only in _JOB_INT_FIELDS:
+            value = _as_int(_get(data, attr))
+            if positive_only and value is not None and value <= 0:
+                value = None  # schema no debería permitirlo, fallback defensivo
+            ints[attr] = value
 
-        tempo_raw = data.get("tempo") or data.get("Tempo")
-        tempo = tempo_raw.strip() if isinstance(tempo_raw, str) else None
+        cad_raw = _get(data, "cadence")
+        cadence = sys.intern(cad_raw.strip()) if type(cad_raw) is str else None
 
-        en_raw = data.get("Eccentric (NEG)") or data.get("eccentric_neg")
-        if isinstance(en_raw, bool):
-            eccentric_neg = en_raw
-        elif isinstance(en_raw, str):
-            eccentric_neg = en_raw.strip().lower() in {"true", "yes", "1"}
-        else:
-            eccentric_neg = False
+        tempo_raw = _get(data, "tempo")
+        tempo = sys.intern(tempo_raw.strip()) if type(tempo_raw) is str else None
 
-        ih_raw = (
-            data.get("isometric (HOLD)")
-            or data.get("Isometric (HOLD)")
-            or data.get("isometric_hold")
-        )
-        if isinstance(ih_raw, bool):
-            isometric_hold = ih_raw
-        elif isinstance(ih_raw, str):
-            isometric_hold = ih_raw.strip().lower() in {"true", "yes", "1"}
-        else:
-            isometric_hold = False
+        eccentric_neg = _as_bool(_get(data, "eccentric_neg"))
+        isometric_hold = _as_bool(_get(data, "isometric_hold"))
 
         db_raw = data.get("death_by")
         if isinstance(db_raw, dict):
@@ -429,64 +513,20 @@ class JobV2:
         else:
             death_by = None
 
-        exs_raw = (
-            data.get("EXERCISES")
-            or data.get("Exercises")
-            or data.get("exercises")
-            or []
-        )
-        exercises = [
+        exs_raw = _get(data, "exercises") or []
+        exercises = tuple([
             ExerciseV2.from_dict(ex_data)
             for ex_data in exs_raw
             if isinstance(ex_data, dict)
-        ]
-
-        core_keys = {
-            "NAME",
-            "name",
-            "MODE",
-            "mode",
-            "description",
-            "Description",
-            "tags",
-            "Rounds",
-            "rounds",
-            "work_time_in_seconds",
-            "work_time_in_minutes",
-            "interval_in_seconds",
-            "rest_time_in_seconds",
-            "Rest_between_exercises_in_seconds",
-            "rest_between_exercises_in_seconds",
-            "Rest_between_rounds_in_seconds",
-            "rest_between_rounds_in_seconds",
-            "cadence",
-            "Cadence",
-            "tempo",
-            "Tempo",
-            "Eccentric (NEG)",
-            "eccentric_neg",
-            "isometric (HOLD)",
-            "Isometric (HOLD)",
-            "isometric_hold",
-            "death_by",
-            "EXERCISES",
-            "Exercises",
-            "exercises",
-        }
-        extra = {k: v for k, v in data.items() if k not in core_keys}
+        ])
+
+        extra = {k: v for k, v in data.items() if k not in _JOB_CORE_KEYS}
 
         return cls(
             name=name,
             mode=mode,
             description=description,
             tags=tags,
-            rounds=rounds,
-            work_time_in_seconds=work_time_in_seconds,
-            work_time_in_minutes=work_time_in_minutes,
-            interval_in_seconds=interval_in_seconds,
-            rest_time_in_seconds=rest_time_in_seconds,
-            rest_between_exercises_in_seconds=rest_between_exercises_in_seconds,
-            rest_between_rounds_in_seconds=rest_between_rounds_in_seconds,
             cadence=cadence,
             tempo=tempo,
             eccentric_neg=eccentric_neg,
@@ -494,6 +534,7 @@ class JobV2:
             death_by=death_by,
             exercises=exercises,
             extra=extra,
+            **ints,
         )
 
 
@@ -502,28 +543,25 @@ class JobV2:
 # -------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class StageV2:
     name: str
     description: Optional[str] = None
     tags: List[str] = field(default_factory=list)
-    jobs: List[JobV2] = field(default_factory=list)
+    jobs: Tuple[JobV2, ...] = ()
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "StageV2":
-        name = str(data.get("NAME") or data.get("name")).strip()
-
-        desc_raw = data.get("Description") or data.get("description")
-        description = desc_raw.strip() if isinstance(desc_raw, str) else None
+        name, description = _name_and_description(data)
 
         tags = _as_tags(data.get("tags"))
 
-        jobs_raw = data.get("JOBS") or data.get("jobs") or []
-        jobs = [
+        jobs_raw = _get(data, "jobs") or []
+        jobs = tuple([
             JobV2.from_dict(job_data)
             for job_data in jobs_raw
             if isinstance(job_data, dict)
-        ]
+        ])
 
         return cls(name=name, description=description, tags=tags, jobs=jobs)
 
@@ -533,38 +571,38 @@ class StageV2:
 # -------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkoutV2:
     name: str
     description: Optional[str] = None
     tags: List[str] = field(default_factory=list)
-    stages: List[StageV2] = field(default_factory=list)
-    raw: Dict[str, Any] = field(default_factory=dict)
+    stages: Tuple[StageV2, ...] = ()
+    raw: Optional[Dict[str, Any]] = None
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "WorkoutV2":
+    def from_dict(cls, data: Dict[str, Any], *, keep_raw: bool = False) -> "WorkoutV2":
         """
         Construye WorkoutV2 desde el dict ya validado por JSON Schema.
-        """
-        name = str(data.get("NAME") or data.get("name")).strip()
 
-        desc_raw = data.get("Description") or data.get("description")
-        description = desc_raw.strip() if isinstance(desc_raw, str) else None
+        Con keep_raw=True se guarda una copia del dict original en `raw`; por
+        defecto no, para no mantener vivo todo el árbol YAML (p.ej. en la
+        caché de modelos del loader).
+        """
+        name, description = _name_and_description(data)
 
         tags = _as_tags(data.get("tags"))
 
-        stages_raw = data.get("STAGES") or data.get("stages") or []
-        stages = [
+        stages_raw = _get(data, "stages") or []
+        stages = tuple([
             StageV2.from_dict(stage_data)
             for stage_data in stages_raw
             if isinstance(stage_data, dict)
-        ]
+        ])
 
-        # Guardamos una copia del dict original por si hace falta en el futuro
         return cls(
             name=name,
             description=description,
             tags=tags,
             stages=stages,
-            raw=dict(data),
+            raw=dict(data) if keep_raw else None,
         )
\ No newline at end of file
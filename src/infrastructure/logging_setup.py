@@ -14,11 +14,13 @@ def configure_logging(
 ) -> None:
     root = logging.getLogger()
 
-    # Root: deja pasar todo; filtramos por handler
-    root_level = logging.DEBUG
-    root.setLevel(root_level)
-
     file_level = logging.DEBUG if debug else logging.INFO
+
+    # Root al nivel más bajo que algún handler acepta: sin --debug, los
+    # log.debug(...) se descartan en isEnabledFor (cacheado) sin construir
+    # el LogRecord ni formatear argumentos.
+    root.setLevel(file_level)
+
     # Consola: por defecto NO spam (solo warnings+)
     stderr_level = logging.WARNING if not debug else logging.INFO
     # Si quieres cero consola incluso warnings, pon CRITICAL aquí:
@@ -11,6 +11,7 @@ historial y scoring por modo.
 from __future__ import annotations
 
 import json
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -22,9 +23,13 @@ def now_iso() -> str:
     return datetime.now().isoformat(timespec="seconds")
 
 
+# Todo lo que no sea alfanumérico (Unicode, como str.isalnum), '-' o '_'.
+_SLUG_INVALID = re.compile(r"[^\w-]")
+
+
 def _slugify(text: str) -> str:
     text = (text or "").strip().lower()
-    return "".join(c if c.isalnum() or c in ("-", "_") else "_" for c in text) or "workout"
+    return _SLUG_INVALID.sub("_", text) or "workout"
 
 
 def get_logs_dir() -> Path:
@@ -6,11 +6,16 @@ import math
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from src.infrastructure.workout_registry import _project_root
 from src.i18n import t
 
+try:  # orjson (opcional): parsea los logs desde bytes, sin decodificar a str
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - sin orjson: json de la stdlib
+    _orjson = None
+
 
 # ---------------------------------------------------------------------------
 # Localización de logs
@@ -48,7 +53,7 @@ RUN_LOGS_DIR: Path = _detect_logs_dir()
 # Modelos de stats (simples, para lectura)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class WorkoutRunSummary:
     """
     Resumen de UNA ejecución concreta de un workout.
@@ -60,7 +65,7 @@ class WorkoutRunSummary:
     total_duration_seconds: Optional[float]
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkoutStats:
     """
     Stats agregadas por workout_name.
@@ -114,13 +119,26 @@ def iter_run_log_paths(logs_dir: Optional[Path] = None) -> Iterable[Path]:
     return files
 
 
+def _loads_json(data: bytes) -> Any:
+    """orjson si está disponible; si lo rechaza (p.ej. NaN/Infinity, que json
+    sí acepta), se reintenta con json para que el resultado no dependa de
+    tener orjson instalado."""
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
 def load_run_log(path: Path) -> Optional[WorkoutRunSummary]:
     """
     Carga un JSON de run y devuelve un resumen normalizado.
     Si el fichero está corrupto o no es un dict, devuelve None.
     """
     try:
-        raw = json.loads(path.read_text(encoding="utf-8"))
+        data = path.read_bytes()
+        raw = _loads_json(data)
     except Exception:
         return None
 
@@ -151,10 +169,38 @@ def load_run_log(path: Path) -> Optional[WorkoutRunSummary]:
     )
 
 
+# Resúmenes ya parseados por ruta, con (mtime_ns, tamaño) del fichero: los
+# logs no se reescriben, así que en un proceso largo (web) cada informe solo
+# parsea los logs nuevos o modificados. load_all_runs poda las rutas que ya
+# no aparecen en el listado (logs borrados o rotados).
+_SUMMARY_CACHE: Dict[str, Tuple[Tuple[int, int], Optional[WorkoutRunSummary]]] = {}
+
+
+def _load_run_log_cached(path: Path) -> Optional[WorkoutRunSummary]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = str(path)
+    hit = _SUMMARY_CACHE.get(key)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    summary = load_run_log(path)
+    _SUMMARY_CACHE[key] = (stamp, summary)
+    return summary
+
+
 def load_all_runs(logs_dir: Optional[Path] = None) -> List[WorkoutRunSummary]:
+    paths = list(iter_run_log_paths(logs_dir))
+    listed = {str(p) for p in paths}
+    for key in list(_SUMMARY_CACHE):
+        if key not in listed:
+            _SUMMARY_CACHE.pop(key, None)
+
     summaries: List[WorkoutRunSummary] = []
-    for path in iter_run_log_paths(logs_dir):
-        summary = load_run_log(path)
+    for path in paths:
+        summary = _load_run_log_cached(path)
         if summary is not None:
             summaries.append(summary)
     return summaries
@@ -164,50 +210,60 @@ def load_all_runs(logs_dir: Optional[Path] = None) -> List[WorkoutRunSummary]:
 # Agregación de stats
 # ---------------------------------------------------------------------------
 
+@dataclass(slots=True)
+class _WorkoutAcc:
+    """Acumulador de una pasada por workout (ver compute_stats_per_workout)."""
+    sessions: int = 0
+    n_dur: int = 0
+    sum_dur: float = 0.0
+    min_dur: Optional[float] = None
+    max_dur: Optional[float] = None
+    last_start: Optional[datetime] = None
+
+
 def compute_stats_per_workout(
     runs: Iterable[WorkoutRunSummary],
 ) -> List[WorkoutStats]:
     """
     Agrupa los runs por workout_name y calcula stats agregadas simples.
+
+    Una sola pasada: cada run actualiza los acumuladores de su workout, sin
+    materializar listas intermedias por grupo.
     """
-    grouped: Dict[str, List[WorkoutRunSummary]] = {}
+    acc: Dict[str, _WorkoutAcc] = {}
 
     for run in runs:
-        grouped.setdefault(run.workout_name, []).append(run)
-
-    stats_list: List[WorkoutStats] = []
-
-    for workout_name, ws in grouped.items():
-        # filtramos runs con duración válida
-        durations = [
-            r.total_duration_seconds
-            for r in ws
-            if isinstance(r.total_duration_seconds, (int, float))
-        ]
-
-        if durations:
-            total_sessions = len(ws)
-            avg_dur = sum(durations) / len(durations)
-            min_dur = min(durations)
-            max_dur = max(durations)
-        else:
-            total_sessions = len(ws)
-            avg_dur = min_dur = max_dur = None
+        a = acc.get(run.workout_name)
+        if a is None:
+            a = acc[run.workout_name] = _WorkoutAcc()
+        a.sessions += 1
+
+        # solo cuentan las duraciones válidas
+        d = run.total_duration_seconds
+        if isinstance(d, (int, float)):
+            a.n_dur += 1
+            a.sum_dur += d
+            if a.min_dur is None or d < a.min_dur:
+                a.min_dur = d
+            if a.max_dur is None or d > a.max_dur:
+                a.max_dur = d
 
         # Última sesión por fecha de inicio; si no hay, None
-        valid_dates = [r.started_at for r in ws if r.started_at is not None]
-        last_session_at = max(valid_dates) if valid_dates else None
-
-        stats_list.append(
-            WorkoutStats(
-                workout_name=workout_name,
-                total_sessions=total_sessions,
-                last_session_at=last_session_at,
-                avg_duration_seconds=avg_dur,
-                min_duration_seconds=min_dur,
-                max_duration_seconds=max_dur,
-            )
+        st = run.started_at
+        if st is not None and (a.last_start is None or st > a.last_start):
+            a.last_start = st
+
+    stats_list: List[WorkoutStats] = [
+        WorkoutStats(
+            workout_name=workout_name,
+            total_sessions=a.sessions,
+            last_session_at=a.last_start,
+            avg_duration_seconds=a.sum_dur / a.n_dur if a.n_dur else None,
+            min_duration_seconds=a.min_dur,
+            max_duration_seconds=a.max_dur,
         )
+        for workout_name, a in acc.items()
+    ]
 
     # Ordenamos por nombre para salida estable
     stats_list.sort(key=lambda s: s.workout_name.lower())
@@ -274,7 +330,7 @@ def build_stats_report(logs_dir: Optional[Path] = None) -> str:
 # PRs / marcas por job (a partir de los scores capturados en modo driven)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class PRSummary:
     workout_name: str
     job_name: str
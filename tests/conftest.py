@@ -0,0 +1,14 @@
+# tests/conftest.py
+from __future__ import annotations
+
+import pytest
+
+from src.application.workout_loader import clear_model_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_model_cache():
+    """La caché de workouts es de módulo: cada test empieza y acaba vacío."""
+    clear_model_cache()
+    yield
+    clear_model_cache()
@@ -6,8 +6,9 @@ import textwrap
 
 import pytest
 
-from src.application import library
+from src.application import components, library
 from src.application.workout_loader import WorkoutLoadError
+from src.infrastructure import workout_registry
 
 VALID = """
     name: Lib Test
@@ -36,10 +37,18 @@ INVALID = """
 """
 
 
-def test_import_valid_and_resolve(tmp_path, monkeypatch):
+@pytest.fixture
+def lib(tmp_path, monkeypatch):
+    """Biblioteca, componentes y registro bajo tmp_path (nada toca data/)."""
     lib = tmp_path / "lib"
     lib.mkdir()
     monkeypatch.setattr(library, "LIBRARY_DIR", lib)
+    monkeypatch.setattr(components, "_project_root", lambda: tmp_path)
+    monkeypatch.setattr(workout_registry, "_project_root", lambda: tmp_path)
+    return lib
+
+
+def test_import_valid_and_resolve(tmp_path, lib):
 
     src = tmp_path / "external.yaml"
     src.write_text(textwrap.dedent(VALID), encoding="utf-8")
@@ -53,12 +62,12 @@ def test_import_valid_and_resolve(tmp_path, monkeypatch):
     assert library.resolve("external") == dest
     assert library.resolve("1") == dest
     assert library.is_in_library(dest)
+    # registro y componentes quedan en tmp_path
+    assert (tmp_path / "data" / workout_registry.REGISTRY_FILENAME).is_file()
+    assert components.job_names() == ["J"]
 
 
-def test_import_invalid_not_stored(tmp_path, monkeypatch):
-    lib = tmp_path / "lib"
-    lib.mkdir()
-    monkeypatch.setattr(library, "LIBRARY_DIR", lib)
+def test_import_invalid_not_stored(tmp_path, lib):
 
     bad = tmp_path / "bad.yaml"
     bad.write_text(textwrap.dedent(INVALID), encoding="utf-8")
@@ -67,3 +76,16 @@ def test_import_invalid_not_stored(tmp_path, monkeypatch):
         library.import_workout(bad)
     # inválido => no se copia nada a la biblioteca
     assert list(lib.glob("*.yaml")) == []
+
+
+def test_import_saves_raw_components(tmp_path, lib):
+    # los componentes se extraen del YAML crudo (MODE sin normalizar), igual
+    # que en components.rebuild_from_library
+
+    src = tmp_path / "external.yaml"
+    src.write_text(
+        textwrap.dedent(VALID).replace("mode: custom_sets", "mode: Custom"),
+        encoding="utf-8",
+    )
+    library.import_workout(src)
+    assert components.get_job("J")["mode"] == "Custom"
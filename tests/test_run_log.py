@@ -48,3 +48,72 @@ def test_stats_reads_fresh_canonical_even_with_legacy_dir(tmp_path, monkeypatch)
 
     report = st.build_stats_report()  # sin dir -> agrega los existentes
     assert "Test WOD" in report
+
+
+def test_slugify_keeps_unicode_alnum():
+    assert run_log._slugify("  Piernas Día 1/2 ") == "piernas_día_1_2"
+    assert run_log._slugify("full-body_wod!") == "full-body_wod_"
+    assert run_log._slugify("") == "workout"
+
+
+def test_load_all_runs_newest_first_skips_broken(tmp_path):
+    import json
+    import os
+
+    from src.infrastructure.stats_v2 import load_all_runs
+
+    for i, name in enumerate(["old", "mid", "new"]):
+        p = tmp_path / f"{name}.json"
+        p.write_text(json.dumps({"workout_name": name, "duration_seconds": i}))
+        os.utime(p, (1_000_000 + i, 1_000_000 + i))
+    (tmp_path / "broken.json").write_text("{not json")
+
+    runs = load_all_runs(logs_dir=tmp_path)
+    assert [r.workout_name for r in runs] == ["new", "mid", "old"]
+
+
+def test_load_all_runs_reparses_only_changed_logs(tmp_path):
+    import json
+    import os
+
+    from src.infrastructure.stats_v2 import load_all_runs
+
+    p = tmp_path / "run.json"
+    p.write_text(json.dumps({"workout_name": "A", "duration_seconds": 10}))
+    (first,) = load_all_runs(logs_dir=tmp_path)
+    (again,) = load_all_runs(logs_dir=tmp_path)
+    assert again is first
+
+    p.write_text(json.dumps({"workout_name": "B", "duration_seconds": 20}))
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    (changed,) = load_all_runs(logs_dir=tmp_path)
+    assert changed.workout_name == "B"
+
+
+def test_load_all_runs_prunes_removed_logs(tmp_path):
+    import json
+
+    from src.infrastructure import stats_v2
+
+    keep = tmp_path / "keep.json"
+    gone = tmp_path / "gone.json"
+    for p in (keep, gone):
+        p.write_text(json.dumps({"workout_name": p.stem, "duration_seconds": 1}))
+    stats_v2.load_all_runs(logs_dir=tmp_path)
+    assert str(gone) in stats_v2._SUMMARY_CACHE
+
+    gone.unlink()
+    runs = stats_v2.load_all_runs(logs_dir=tmp_path)
+    assert [r.workout_name for r in runs] == ["keep"]
+    assert str(gone) not in stats_v2._SUMMARY_CACHE
+    assert str(keep) in stats_v2._SUMMARY_CACHE
+
+
+def test_load_run_log_accepts_nan_tokens(tmp_path):
+    # json de la stdlib acepta NaN/Infinity; con o sin orjson el log se lee
+    p = tmp_path / "run.json"
+    p.write_text('{"workout_name": "N", "duration_seconds": 30, "score": NaN}')
+    summary = load_run_log(p)
+    assert summary is not None
+    assert summary.workout_name == "N"
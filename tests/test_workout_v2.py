@@ -2,16 +2,34 @@
 """Tests del pipeline v2: validación JSON Schema + modelo de dominio WorkoutV2."""
 from __future__ import annotations
 
+import json
+import os
+import shutil
 import textwrap
 from pathlib import Path
 
 import pytest
 
+from internal_tools.schema_loader_v2 import (
+    load_workout_v2,
+    SchemaValidationError,
+    validate_instance_against_schema,
+)
+from src.application import workout_loader
 from src.application.workout_loader import (
     load_workout_v2_model_from_file,
     WorkoutLoadError,
 )
-from src.domain_v2.workout_v2 import JobModeV2, WorkoutV2
+from src.domain_v2.workout_v2 import (
+    ExerciseV2,
+    JobModeV2,
+    JobV2,
+    SetPrescriptionV2,
+    StageV2,
+    WorkoutV2,
+    _as_bool,
+    _as_tags,
+)
 
 ROOT = Path(__file__).resolve().parents[1]
 SCHEMAS = ROOT / "internal_tools" / "schemas"
@@ -48,6 +66,75 @@ def test_from_raw_rejects_unknown():
         JobModeV2.from_raw("not_a_mode")
 
 
+def test_from_raw_rejects_missing_mode():
+    with pytest.raises(ValueError, match=r"MODE in v2: None$"):
+        JobModeV2.from_raw(None)
+    # sin MODE, el job informa None y no el literal 'None'
+    with pytest.raises(ValueError, match=r"MODE in v2: None$"):
+        JobV2.from_dict({"name": "x"})
+
+
+def test_job_aliases_keep_falsy_values():
+    job = JobV2.from_dict({
+        "NAME": "x",
+        "MODE": "custom_sets",
+        "Rounds": 3,
+        "Rest_between_rounds_in_seconds": 0,
+        "rest_between_rounds_in_seconds": 60,
+    })
+    assert job.name == "x"
+    assert job.rounds == 3
+    assert job.rest_between_rounds_in_seconds == 0
+
+
+def test_description_priority_per_entity():
+    both = {"name": "x", "Description": "upper", "description": "lower"}
+    assert JobV2.from_dict({**both, "mode": "custom_sets"}).description == "lower"
+    assert StageV2.from_dict(both).description == "upper"
+    assert WorkoutV2.from_dict(both).description == "upper"
+    # un valor vacío cede al otro alias
+    assert StageV2.from_dict({**both, "Description": ""}).description == "lower"
+
+
+def test_job_int_fields_reject_bool():
+    job = JobV2.from_dict({
+        "NAME": "x",
+        "MODE": "emom",
+        "rounds": True,
+        "interval_in_seconds": 60.0,
+    })
+    assert job.rounds is None
+    assert job.interval_in_seconds == 60
+    assert type(job.interval_in_seconds) is int
+
+
+def test_exercise_numeric_fields_reject_bool():
+    ex = ExerciseV2.from_dict({
+        "name": "X",
+        "reps": True,
+        "weight": False,
+        "intra_set": {"type": "cluster", "mini_sets": [3, True, 2], "rest_seconds": True},
+    })
+    assert ex.reps is None
+    assert ex.weight is None
+    assert ex.intra_set.mini_sets == [3, 2]
+    assert ex.intra_set.rest_seconds is None
+
+
+def test_scalar_fields_from_yaml_values():
+    # valores tal como los entrega el YAML (bool, str, int, None)
+    assert SetPrescriptionV2.from_dict({"reps": True}).reps is None
+    assert _as_bool(True) is True
+    assert _as_bool(" Yes ") is True
+    assert _as_bool("no") is False
+    assert _as_bool(None) is False
+    assert _as_tags(" legs ") == ["legs"]
+    assert _as_tags(["a", " ", 3]) == ["a", "3"]
+    assert _as_tags(None) == []
+    job = JobV2.from_dict({"name": "x", "mode": "custom_sets", "cadence": " 3-1-1 "})
+    assert job.cadence == "3-1-1"
+
+
 # ---------------------------------------------------------------------------
 # Pipeline completo: validar + construir modelo
 # ---------------------------------------------------------------------------
@@ -86,6 +173,57 @@ def test_load_valid_workout(tmp_path):
     assert jobs[0].exercises[0].reps == 10
 
 
+@pytest.fixture
+def load_calls(monkeypatch):
+    """Rutas que llegan al loader de schemas (las que no sirve la caché)."""
+    calls = []
+    real_load = workout_loader._load_workout_v2
+
+    def counting_load(**kwargs):
+        calls.append(kwargs["path"])
+        return real_load(**kwargs)
+
+    monkeypatch.setattr(workout_loader, "_load_workout_v2", counting_load)
+    return calls
+
+
+def test_model_cached_by_content(tmp_path, load_calls):
+    calls = load_calls
+    path = _write(tmp_path, VALID)
+    w1 = load_workout_v2_model_from_file(path=path, schema_root=SCHEMAS)
+    w2 = load_workout_v2_model_from_file(path=path, schema_root=SCHEMAS)
+    assert len(calls) == 1  # el segundo load no repite parseo ni validación
+    assert w1 == w2
+
+    # cada llamada recibe su propia instancia: mutar una no afecta a otras
+    assert w1 is not w2
+    w1.tags.append("mutado")
+    w1.stages[0].jobs[0].exercises[0].extra["x"] = 1
+    w3 = load_workout_v2_model_from_file(path=path, schema_root=SCHEMAS)
+    assert w3 == w2
+    assert "mutado" not in w3.tags
+
+    path.write_text(textwrap.dedent(VALID).replace("Test WOD", "Otro WOD"), encoding="utf-8")
+    w4 = load_workout_v2_model_from_file(path=path, schema_root=SCHEMAS)
+    assert len(calls) == 2
+    assert w4.name == "Otro WOD"
+
+
+def test_model_cache_invalidated_by_schema_change(tmp_path, load_calls):
+    schemas = tmp_path / "schemas"
+    shutil.copytree(SCHEMAS, schemas)
+    path = _write(tmp_path, VALID)
+    load_workout_v2_model_from_file(path=path, schema_root=schemas)
+    load_workout_v2_model_from_file(path=path, schema_root=schemas)
+    assert len(load_calls) == 1
+
+    target = schemas / "workout.schema.json"
+    st = target.stat()
+    os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    load_workout_v2_model_from_file(path=path, schema_root=schemas)
+    assert len(load_calls) == 2
+
+
 def test_synonyms_are_normalized(tmp_path):
     w = load_workout_v2_model_from_file(
         path=_write(tmp_path, """
@@ -113,6 +251,44 @@ def test_synonyms_are_normalized(tmp_path):
     assert JobModeV2.CUSTOM_SETS in modes       # super_sets -> custom_sets
 
 
+TABATA_JOB = """
+    name: Mixed
+    stages:
+      - name: S
+        jobs:
+          - name: J
+            mode: "  TaBaTa "
+            rounds: 8
+            work_time_in_seconds: {work}
+            exercises:
+              - name: X
+                reps: 10
+"""
+
+
+def test_mixed_case_mode_validates_against_its_schema(tmp_path):
+    data = load_workout_v2(
+        path=_write(tmp_path, TABATA_JOB.format(work=20)), schema_root=SCHEMAS
+    )
+    assert data["stages"][0]["jobs"][0]["mode"] == "tabata"
+
+    # una violación propia de job.tabata.schema.json demuestra el dispatch
+    with pytest.raises(SchemaValidationError, match="mode='tabata'"):
+        load_workout_v2(
+            path=_write(tmp_path, TABATA_JOB.format(work='"veinte"')),
+            schema_root=SCHEMAS,
+        )
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_unknown_mode_raises_schema_error(tmp_path, validate):
+    # MODE desconocido: falla en la normalización, antes que cualquier
+    # validación (también con validate=False)
+    path = _write(tmp_path, TABATA_JOB.format(work=20).replace("TaBaTa", "zumba"))
+    with pytest.raises(SchemaValidationError, match="unsupported MODE '  zumba '"):
+        load_workout_v2(path=path, schema_root=SCHEMAS, validate=validate)
+
+
 def test_ladder_supported(tmp_path):
     w = load_workout_v2_model_from_file(
         path=_write(tmp_path, """
@@ -409,3 +585,57 @@ def test_rejects_missing_required(tmp_path):
             """),
             schema_root=SCHEMAS,
         )
+
+
+def test_validate_false_skips_schemas(tmp_path):
+    # Opt-in para ficheros ya validados: no pasa por los JSON Schemas
+    w = load_workout_v2_model_from_file(
+        path=_write(tmp_path, """
+            name: Trusted
+            stages:
+              - name: S
+                jobs:
+                  - name: J
+                    mode: custom
+                    exercises:
+                      - name: X
+                        reps: 1
+        """),
+        schema_root=SCHEMAS,
+        validate=False,
+    )
+    job = w.stages[0].jobs[0]
+    assert job.mode is JobModeV2.CUSTOM_SETS
+    assert job.rounds is None
+
+
+def test_validate_false_keeps_load_error_contract(tmp_path):
+    # Sin schemas, un job sin MODE falla al construir el modelo: sigue
+    # saliendo como WorkoutLoadError (lo que esperan library.load y la CLI)
+    with pytest.raises(WorkoutLoadError, match="MODE"):
+        load_workout_v2_model_from_file(
+            path=_write(tmp_path, """
+                name: Trusted
+                stages:
+                  - name: S
+                    jobs:
+                      - name: J
+                        exercises:
+                          - name: X
+                            reps: 1
+            """),
+            schema_root=SCHEMAS,
+            validate=False,
+        )
+
+
+def test_schema_validator_reloaded_when_schema_changes(tmp_path):
+    schema = tmp_path / "s.schema.json"
+    schema.write_text(json.dumps({"type": "object"}), encoding="utf-8")
+    validate_instance_against_schema(instance={"a": 1}, schema_path=schema)
+
+    schema.write_text(json.dumps({"type": "array"}), encoding="utf-8")
+    st = schema.stat()
+    os.utime(schema, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    with pytest.raises(SchemaValidationError):
+        validate_instance_against_schema(instance={"a": 1}, schema_path=schema)